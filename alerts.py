@@ -0,0 +1,252 @@
+"""
+Deal Alert Engine for Wine Intelligence Elite.
+Συγκρίνει τις προσφορές των καταστημάτων (`wines`) με τις αναμενόμενες τιμές
+του `master_list` και καταγράφει ειδοποιήσεις στον πίνακα `deal_alerts`.
+Ελέγχονται ΜΟΝΟ οι νέες ή αλλαγμένες προσφορές κάθε κύκλου ανανέωσης.
+"""
+
+import re
+import sqlite3
+import unicodedata
+from datetime import datetime, timedelta
+import pandas as pd
+import versions
+
+DB_NAME = 'wines.db'
+HISTORY_DAYS = 90
+
+# Κανόνες: (id κανόνα, περιγραφή, συνθήκη πάνω στην προσφορά)
+# Η προσφορά έχει: price, expected_price, rating, low_90d (ελάχιστη τιμή 90 ημερών)
+ALERT_RULES = [
+    ("under_expected_15", "Τιμή ≥15% κάτω από την αναμενόμενη",
+     lambda o: bool(o['expected_price']) and o['price'] <= o['expected_price'] * 0.85),
+    ("rated_92_under_20", "Rating ≥ 92 και κάτω από 20€",
+     lambda o: (o['rating'] or 0) >= 92 and o['price'] < 20),
+    ("lowest_90_days", f"Νέα χαμηλότερη τιμή {HISTORY_DAYS} ημερών",
+     lambda o: o['low_90d'] is not None and o['price'] < o['low_90d']),
+]
+
+
+def _tokens(text):
+    """Πεζά, χωρίς τόνους, σπασμένα σε λέξεις."""
+    text = unicodedata.normalize('NFD', str(text or "").lower())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return set(re.findall(r"\w+", text))
+
+
+def ensure_alert_tables(conn):
+    """Δημιουργεί τους πίνακες της μηχανής ειδοποιήσεων αν δεν υπάρχουν."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS offer_state (
+            url TEXT PRIMARY KEY,
+            price REAL,
+            master_id INTEGER,
+            updated_at TEXT
+        )""")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS price_history (
+            master_id INTEGER,
+            price REAL,
+            seen_at TEXT
+        )""")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_price_history_master "
+        "ON price_history (master_id, seen_at)"
+    )
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS deal_alerts (
+            id INTEGER PRIMARY KEY,
+            rule TEXT,
+            master_id INTEGER,
+            wine_name TEXT,
+            title TEXT,
+            shop TEXT,
+            url TEXT,
+            price REAL,
+            expected_price REAL,
+            rating REAL,
+            message TEXT,
+            created_at TEXT,
+            UNIQUE (rule, url, price)
+        )""")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_deal_alerts_created ON deal_alerts (created_at)"
+    )
+
+
+def build_master_index(masters):
+    """
+    Index λέξεων για το master_list, ώστε κάθε προσφορά να ελέγχεται μόνο
+    απέναντι στα λίγα υποψήφια κρασιά (όχι cross join).
+
+    Args:
+        masters (list): Γραμμές (id, wine_name, expected_price, rating).
+
+    Returns:
+        dict: λέξη -> λίστα από (tokens, master row).
+    """
+    index = {}
+    for row in masters:
+        tokens = _tokens(row[1])
+        if not tokens:
+            continue
+        # Κλειδί: η μεγαλύτερη (συνήθως πιο σπάνια) λέξη του ονόματος
+        key = max(tokens, key=len)
+        index.setdefault(key, []).append((tokens, row))
+    return index
+
+
+def match_offer(title, master_index):
+    """Επιστρέφει το master row που ταιριάζει στον τίτλο της προσφοράς (ή None)."""
+    title_tokens = _tokens(title)
+    best_tokens, best_row = set(), None
+    for token in title_tokens:
+        for tokens, row in master_index.get(token, ()):
+            if tokens <= title_tokens and len(tokens) > len(best_tokens):
+                best_tokens, best_row = tokens, row
+    return best_row
+
+
+def _changed_offers(conn):
+    """Νέες ή αλλαγμένες προσφορές σε σχέση με τον προηγούμενο κύκλο."""
+    return conn.execute("""
+        SELECT w.title, w.price, w.shop, w.url
+        FROM wines w LEFT JOIN offer_state s ON s.url = w.url
+        WHERE w.url IS NOT NULL AND w.price IS NOT NULL
+          AND (s.url IS NULL OR s.price IS NOT w.price)
+        """).fetchall()
+
+
+def _lowest_prices(conn, since):
+    """
+    Ελάχιστη τιμή ανά κρασί του master_list: από το ιστορικό του παραθύρου
+    και από τις προσφορές που είναι ακόμα ενεργές με αμετάβλητη τιμή
+    (αυτές δεν ξαναμπαίνουν στο ιστορικό, αλλά ισχύουν ακόμα).
+    """
+    lowest = dict(conn.execute(
+        "SELECT master_id, MIN(price) FROM price_history "
+        "WHERE seen_at >= ? GROUP BY master_id", (since,)
+    ).fetchall())
+    live = conn.execute("""
+        SELECT s.master_id, MIN(s.price)
+        FROM offer_state s JOIN wines w ON w.url = s.url AND w.price = s.price
+        WHERE s.master_id IS NOT NULL
+        GROUP BY s.master_id
+        """).fetchall()
+    for master_id, price in live:
+        if master_id not in lowest or price < lowest[master_id]:
+            lowest[master_id] = price
+    return lowest
+
+
+# pylint: disable=too-many-locals
+def run_alert_cycle(db_name=DB_NAME, now=None):
+    """
+    Ένας κύκλος ελέγχου: αξιολογεί τους κανόνες στις νέες/αλλαγμένες προσφορές,
+    ενημερώνει το ιστορικό τιμών και αποθηκεύει τις (μοναδικές) ειδοποιήσεις.
+
+    Returns:
+        tuple: (πλήθος προσφορών που ελέγχθηκαν, πλήθος νέων ειδοποιήσεων)
+    """
+    now = now or datetime.now()
+    stamp = now.isoformat(timespec='seconds')
+    since = (now - timedelta(days=HISTORY_DAYS)).isoformat(timespec='seconds')
+
+    with sqlite3.connect(db_name) as conn:
+        ensure_alert_tables(conn)
+        offers = _changed_offers(conn)
+        if not offers:
+            return 0, 0
+
+        master_index = build_master_index(conn.execute(
+            "SELECT id, wine_name, expected_price, rating FROM master_list"
+        ).fetchall())
+        low_90d = _lowest_prices(conn, since)
+
+        states, history, new_alerts = [], [], []
+        # Αύξουσα τιμή: μόνο η φθηνότερη προσφορά του κύκλου γίνεται "νέο χαμηλό"
+        for title, price, shop, url in sorted(offers, key=lambda o: o[1]):
+            master = match_offer(title, master_index)
+            states.append((url, price, master[0] if master else None, stamp))
+            if master is None:
+                continue
+
+            master_id, wine_name, expected_price, rating = master
+            offer = {
+                'price': price, 'expected_price': expected_price,
+                'rating': rating, 'low_90d': low_90d.get(master_id),
+            }
+            for rule_id, description, condition in ALERT_RULES:
+                if condition(offer):
+                    new_alerts.append((
+                        rule_id, master_id, wine_name, title, shop, url, price,
+                        expected_price, rating, f"{description}: {price:.2f}€", stamp
+                    ))
+            history.append((master_id, price, stamp))
+            if offer['low_90d'] is None or price < offer['low_90d']:
+                low_90d[master_id] = price
+
+        # Μία batched εγγραφή για όλο τον κύκλο
+        conn.executemany(
+            "INSERT OR REPLACE INTO offer_state (url, price, master_id, updated_at) "
+            "VALUES (?,?,?,?)", states
+        )
+        conn.executemany(
+            "INSERT INTO price_history (master_id, price, seen_at) VALUES (?,?,?)",
+            history
+        )
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO deal_alerts (rule, master_id, wine_name, title, shop, "
+            "url, price, expected_price, rating, message, created_at) "
+            "VALUES (?,?,?,?,?,?,?,?,?,?,?)", new_alerts
+        )
+        inserted = conn.total_changes - before
+        # Μόνο οι νέες ειδοποιήσεις αλλάζουν ό,τι δείχνει η εφαρμογή
+        if inserted:
+            versions.bump_version(conn, versions.ALERTS)
+        return len(offers), inserted
+
+
+def load_alerts(db_name=DB_NAME, limit=200):
+    """Οι πιο πρόσφατες ειδοποιήσεις ως DataFrame."""
+    with sqlite3.connect(db_name) as conn:
+        ensure_alert_tables(conn)
+        return pd.read_sql(
+            "SELECT created_at, rule, wine_name, title, shop, price, expected_price, "
+            "rating, message, url FROM deal_alerts ORDER BY created_at DESC, id DESC "
+            "LIMIT ?", conn, params=(limit,)
+        )
+
+
+def build_digest(alerts_df):
+    """
+    Κείμενο digest ομαδοποιημένο ανά κανόνα.
+
+    Args:
+        alerts_df (pd.DataFrame): Αποτέλεσμα της load_alerts.
+
+    Returns:
+        str: Το digest σε μορφή Markdown.
+    """
+    lines = ["# 🍷 Wine Intelligence Elite - Deal Digest", ""]
+    if alerts_df.empty:
+        lines.append("Δεν υπάρχουν νέες ευκαιρίες.")
+        return "\n".join(lines)
+
+    descriptions = {rule_id: description for rule_id, description, _ in ALERT_RULES}
+    for rule_id, group in alerts_df.groupby('rule', sort=False):
+        lines.append(f"## {descriptions.get(rule_id, rule_id)} ({len(group)})")
+        for _, alert in group.iterrows():
+            lines.append(
+                f"- {alert['wine_name']} @ {alert['shop']}: {alert['price']:.2f}€ "
+                f"({alert['url']})"
+            )
+        lines.append("")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    checked, created = run_alert_cycle()
+    print(f"🔔 Ελέγχθηκαν {checked} νέες/αλλαγμένες προσφορές.")
+    print(f"🚀 Νέες ειδοποιήσεις: {created}")
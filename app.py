@@ -3,13 +3,17 @@ Wine Intelligence Elite App.
 Optimized for Pylint 10/10 score.
 """
 
-import os
 import io
 import re  # Moved to top level
+import numpy as np
 import pandas as pd
 import altair as alt
 import streamlit as st
+import alerts
+import assets
+import query_cache
 import services
+import versions
 
 # --- CONFIGURATION ---
 st.set_page_config(
@@ -20,14 +24,37 @@ st.set_page_config(
 )
 
 # --- CACHING & DATA LOADING ---
-@st.cache_data
-def get_wine_data():
-    """Wrapper για φόρτωση δεδομένων με caching."""
+# Μία παλιά έκδοση αρκεί για όσα sessions τρέχουν ακόμα με αυτή·
+# οι παλαιότερες βγαίνουν από τη μνήμη αντί να συσσωρεύονται.
+@st.cache_data(max_entries=2)
+def get_wine_data(data_version):  # pylint: disable=unused-argument
+    """Wrapper για φόρτωση δεδομένων με caching (ανά έκδοση δεδομένων)."""
     return services.load_wine_data()
 
+@st.cache_data(max_entries=2)
+def get_award_critics(data_version):  # pylint: disable=unused-argument
+    """Wrapper για τους κριτικούς του πίνακα wine_awards με caching (ανά έκδοση δεδομένων)."""
+    return services.get_award_critics()
+
+@st.cache_data(max_entries=2)
+def get_award_wine_ids(critic, min_points, gold_only, data_version):  # pylint: disable=unused-argument
+    """Wrapper για τα φίλτρα βραβείων με caching (ανά έκδοση δεδομένων)."""
+    return services.find_award_wine_ids(critic, min_points, gold_only)
+
+@st.cache_data(max_entries=2)
+def get_deal_alerts(alerts_version):  # pylint: disable=unused-argument
+    """Wrapper για τις ειδοποιήσεις προσφορών με caching (ανά έκδοση ειδοποιήσεων)."""
+    return services.load_deal_alerts()
+
+@st.cache_resource
+def get_assets():
+    """Δημιουργεί μία φορά ανά διεργασία τις εκδοχές των εικόνων."""
+    return assets.build_assets()
+
 def clear_app_cache():
     """Καθαρίζει την cache."""
     st.cache_data.clear()
+    query_cache.clear()
 
 # --- HELPER: ΔΥΝΑΜΙΚΑ TAGS ---
 def get_unique_food_tags(df):
@@ -67,14 +94,40 @@ def apply_custom_css():
         </style>
         """, unsafe_allow_html=True)
 
-def render_sidebar(df):
+def render_awards_filters(data_version):
+    """Φίλτρα βραβείων (wine_awards): κριτικός με ελάχιστους πόντους και Gold μετάλλιο."""
+    critics = get_award_critics(data_version)
+    critic = st.selectbox(
+        "🏆 Κριτικός",
+        ["Όλοι"] + critics['critic'].tolist()
+    )
+    min_points = None
+    if critic != "Όλοι":
+        row = critics[critics['critic'] == critic].iloc[0]
+        min_points = st.number_input(
+            f"{critic} ≥",
+            min_value=0.0,
+            max_value=float(row['max_points']),
+            value=float(row['min_points']),
+            step=0.5 if row['max_points'] <= 5 else 1.0
+        )
+    else:
+        critic = None
+    gold_only = st.checkbox("🥇 Μόνο κρασιά με Gold μετάλλιο")
+    return critic, min_points, gold_only
+
+def render_sidebar(df, data_version):
     """Sidebar με διορθωμένο Budget και Κείμενα."""
     with st.sidebar:
-        if os.path.exists("logo.png"):
-            # Χρησιμοποιούμε _ για τις μεταβλητές που δεν θέλουμε (col1, col3)
-            _, col2, _ = st.columns([1, 2, 1])
-            with col2:
-                st.image("logo.png", width=130)
+        logo = get_assets()["logo"]
+        if logo:
+            # Έτοιμες εκδοχές 130/260px αντί για το αρχικό PNG των 1.9 MB
+            st.markdown(
+                "<div style='text-align: center;'>"
+                f"{assets.picture_html(logo, 'Wine Intelligence Elite', '130px')}"
+                "</div>",
+                unsafe_allow_html=True
+            )
 
         st.markdown(
             "<h3 style='text-align: center; color: #444;'>Wine Selection</h3>",
@@ -122,6 +175,8 @@ def render_sidebar(df):
 
         sort = st.selectbox("📊 Ταξινόμηση", ["VfM Score", "Τιμή (Αύξουσα)", "Rating"])
 
+        awards_filter = render_awards_filters(data_version)
+
         st.markdown("<br><br>", unsafe_allow_html=True)
         st.divider()
 
@@ -130,16 +185,34 @@ def render_sidebar(df):
             input_pass = st.text_input("Admin Key", type="password")
             # Απλοποίηση χωρίς παρενθέσεις
             is_admin = input_pass == "lara"
+            if is_admin:
+                cache = query_cache.stats()
+                st.caption(
+                    f"🗄️ Query cache: {cache['hits']} hits / {cache['misses']} misses / "
+                    f"{cache['evictions']} evictions · {cache['entries']} entries "
+                    f"({cache['bytes'] / 1024:.1f} KB)"
+                )
 
-    return search, cats, price, sort, selected_food, is_admin
+    return search, cats, price, sort, selected_food, awards_filter, is_admin
 
 def render_hero_section():
     """Εμφανίζει την κεντρική εικόνα και τον τίτλο."""
-    st.image(
-        "https://images.unsplash.com/photo-1506377247377-2a5b3b417ebb"
-        "?auto=format&fit=crop&w=2070",
-        use_container_width=True
-    )
+    hero = get_assets()["hero"]
+    if hero:
+        st.markdown(
+            assets.picture_html(
+                hero, "Wine Intelligence Elite", "100vw",
+                "width: 100%; height: auto; border-radius: 8px;"
+            ),
+            unsafe_allow_html=True
+        )
+    else:
+        # Τοπικό fallback χωρίς εξωτερικό αίτημα (λειτουργεί και offline)
+        st.markdown("""
+            <div style='height: 160px; border-radius: 8px;
+                        background: linear-gradient(135deg, #4a1c2a 0%, #7b2d3f 45%,
+                                                    #84A98C 100%);'></div>
+        """, unsafe_allow_html=True)
     st.markdown("""
         <div style='text-align: center; padding: 10px 0 20px 0;'>
             <h1 style='color: #1b5e20; margin:0;'>🍷 Wine Intelligence Elite</h1>
@@ -148,36 +221,70 @@ def render_hero_section():
         <hr>
     """, unsafe_allow_html=True)
 
-# pylint: disable=too-many-arguments
-def filter_data(df, search, cats, price, sort_option, food_pairing):
-    """Φιλτράρει τα δεδομένα με βάση τις επιλογές του χρήστη."""
-    filt_df = df.copy()
-    filt_df = filt_df[
-        (filt_df['best_price'] >= price[0]) &
-        (filt_df['best_price'] <= price[1])
-    ]
+def _filter_mask(df, filters, data_version):
+    """Boolean mask των γραμμών που περνούν τα φίλτρα (χωρίς ταξινόμηση)."""
+    search, cats, price, _, food_pairing, awards_filter = filters
+    prices = df['best_price']
+    mask = (prices >= price[0]) & (prices <= price[1])
+
+    # Index lookup στον πίνακα wine_awards (None = χωρίς φίλτρο βραβείων)
+    if awards_filter is not None:
+        award_ids = get_award_wine_ids(*awards_filter, data_version)
+        if award_ids is not None:
+            mask &= df['id'].isin(award_ids)
 
     if cats:
-        filt_df = filt_df[filt_df['category'].isin(cats)]
+        mask &= df['category'].isin(cats)
 
+    # Το search έχει ήδη κανονικοποιηθεί (strip + casefold) από την filter_data
     if search:
-        filt_df = filt_df[filt_df['wine_name'].str.contains(search, case=False)]
+        mask &= df['wine_name'].fillna("").str.casefold().str.contains(search, regex=False)
 
     if food_pairing:
         safe_tags = [re.escape(tag) for tag in food_pairing]
         pattern = '|'.join(safe_tags)
-        filt_df = filt_df[
-            filt_df['food_pairing'].str.contains(pattern, case=False, na=False)
-        ]
+        mask &= df['food_pairing'].str.contains(pattern, case=False, na=False)
 
-    if sort_option == "VfM Score":
-        filt_df = filt_df.sort_values(by="VfM_Score", ascending=False)
-    elif sort_option == "Τιμή (Αύξουσα)":
-        filt_df = filt_df.sort_values(by="best_price", ascending=True)
-    elif sort_option == "Rating":
-        filt_df = filt_df.sort_values(by="score", ascending=False)
+    return mask
 
-    return filt_df
+def _filter_positions(df, filters, data_version):
+    """Υπολογίζει τις θέσεις (iloc) των γραμμών που περνούν τα φίλτρα, ταξινομημένες."""
+    positions = np.flatnonzero(_filter_mask(df, filters, data_version).to_numpy())
+
+    sort_columns = {
+        "VfM Score": ("VfM_Score", False),
+        "Τιμή (Αύξουσα)": ("best_price", True),
+        "Rating": ("score", False),
+    }
+    sort_option = filters[3]
+    if sort_option in sort_columns:
+        column, ascending = sort_columns[sort_option]
+        values = df[column].to_numpy(dtype=float)[positions]
+        order = np.argsort(values if ascending else -values, kind='stable')
+        positions = positions[order]
+
+    return positions
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def filter_data(df, search, cats, price, sort_option, food_pairing,
+                awards_filter=None, data_version=None):
+    """
+    Φιλτράρει τα δεδομένα με βάση τις επιλογές του χρήστη.
+    Με data_version, το αποτέλεσμα (θέσεις γραμμών) μοιράζεται μέσω της query_cache.
+    """
+    # Η ίδια κανονικοποίηση για το κλειδί της cache ΚΑΙ για το φίλτρο
+    search = (search or "").strip().casefold()
+    filters = (search, cats, price, sort_option, food_pairing, awards_filter)
+
+    if data_version is None:
+        return df.iloc[_filter_positions(df, filters, data_version)]
+
+    key = query_cache.make_key(data_version, *filters)
+    positions = query_cache.get(key)
+    if positions is None:
+        positions = _filter_positions(df, filters, data_version)
+        query_cache.put(key, positions)
+    return df.iloc[positions]
 
 def render_metrics(df):
     """Εμφανίζει τα Top 4 κρασιά."""
@@ -232,28 +339,68 @@ def render_charts_and_calculator(df):
                     st.warning("Δεν υπάρχουν αρκετά κρασιά.")
     st.write("---")
 
+def render_deal_alerts(is_admin):
+    """Εμφανίζει τις ειδοποιήσεις προσφορών και το digest."""
+    alerts_df = get_deal_alerts(services.get_data_version(versions.ALERTS))
+
+    with st.expander(f"🔔 Ευκαιρίες Αγοράς ({len(alerts_df)})", expanded=False):
+        if alerts_df.empty:
+            st.info("Δεν υπάρχουν ειδοποιήσεις προσφορών.")
+        else:
+            st.dataframe(
+                alerts_df[['created_at', 'wine_name', 'shop', 'price',
+                           'expected_price', 'message', 'url']],
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    "url": st.column_config.LinkColumn("🛒 Link", display_text="Κατάστημα"),
+                    "price": st.column_config.NumberColumn("Τιμή (€)", format="%.2f €"),
+                    "expected_price": st.column_config.NumberColumn(
+                        "Αναμενόμενη (€)", format="%.2f €"
+                    ),
+                }
+            )
+            st.download_button(
+                "📨 DIGEST",
+                alerts.build_digest(alerts_df),
+                "Deal_Digest.md",
+                "text/markdown"
+            )
+
+        if is_admin and st.button("🔔 Έλεγχος Προσφορών"):
+            # Νέα έκδοση ειδοποιήσεων: η cache του καταλόγου μένει ως έχει
+            checked, created = services.refresh_deal_alerts()
+            st.success(f"✅ {checked} προσφορές, {created} νέες ειδοποιήσεις.")
+    st.write("---")
+
 # pylint: disable=too-many-locals
 def main():
     """Κύρια συνάρτηση εφαρμογής."""
     apply_custom_css()
 
     # 1. Φόρτωση
-    df_main = get_wine_data()
+    data_version = services.get_data_version()
+    df_main = get_wine_data(data_version)
     if df_main.empty:
         st.error("⚠️ Η βάση είναι κενή.")
         return
 
     # 2. Sidebar
-    search, cats, price, sort, food_pairing, is_admin = render_sidebar(df_main)
+    search, cats, price, sort, food_pairing, awards_filter, is_admin = render_sidebar(
+        df_main, data_version
+    )
 
     render_hero_section()
 
     # 3. Φίλτρα
-    filt_df = filter_data(df_main, search, cats, price, sort, food_pairing)
+    filt_df = filter_data(
+        df_main, search, cats, price, sort, food_pairing, awards_filter, data_version
+    )
 
     # 4. Dashboard
     render_metrics(filt_df)
     render_charts_and_calculator(filt_df)
+    render_deal_alerts(is_admin)
 
     # 5. Editor
     st.markdown("### 🍷 Λίστα & Επεξεργασία")
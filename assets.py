@@ -0,0 +1,155 @@
+"""
+Asset Pipeline for Wine Intelligence Elite.
+Δημιουργεί μία φορά (startup ή `python assets.py`) μικρότερες, συμπιεσμένες εκδοχές
+των εικόνων (WebP + PNG/JPEG) στα πλάτη που εμφανίζονται στην εφαρμογή.
+Τα bytes κρατιούνται στη μνήμη και, όταν η εφαρμογή τρέχει μέσω `server.py`,
+σερβίρονται από το route `/assets/` με `Cache-Control: immutable` (το όνομα
+περιέχει το hash του περιεχομένου). Με σκέτο `streamlit run app.py` σερβίρονται
+από το `static/`, όπου το Streamlit δεν στέλνει Cache-Control.
+"""
+
+import hashlib
+import os
+from PIL import Image
+
+STATIC_DIR = 'static'
+STATIC_URL = 'app/static'
+ASSET_ROUTE_URL = 'assets'
+EXTENSIONS = {"webp": "webp", "png": "png", "jpeg": "jpg"}
+MEDIA_TYPES = {"webp": "image/webp", "png": "image/png", "jpeg": "image/jpeg"}
+
+# Εκδοχές στη μνήμη: όνομα αρχείου με hash -> (bytes, media type)
+_variants = {}
+_route = {'enabled': False}
+
+# (όνομα, αρχείο πηγής, πλάτη σε px) - το 2x πλάτος καλύπτει οθόνες retina
+ASSET_SOURCES = [
+    ("logo", "logo.png", (130, 260)),
+    ("hero", "hero.jpg", (640, 1280, 1920)),
+]
+
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+
+
+def _fallback_format(source):
+    """PNG για εικόνες με διαφάνεια (logo), JPEG για φωτογραφίες."""
+    return "png" if source.lower().endswith(".png") else "jpeg"
+
+
+def _save_variant(image, path, fmt):
+    """Αποθηκεύει μία εκδοχή με τις ρυθμίσεις συμπίεσης του format."""
+    if fmt == "webp":
+        image.save(path, "WEBP", quality=WEBP_QUALITY, method=6)
+    elif fmt == "png":
+        image.save(path, "PNG", optimize=True)
+    else:
+        image.convert("RGB").save(
+            path, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True
+        )
+
+
+def enable_asset_route():
+    """Καλείται από το server.py: τα URLs δείχνουν στο route /assets/."""
+    _route['enabled'] = True
+
+
+def get_variant(filename):
+    """Επιστρέφει (bytes, media type) μιας εκδοχής ή None."""
+    return _variants.get(filename)
+
+
+def _load_variant(source, path, width, fmt):
+    """Διαβάζει μία εκδοχή από το static/, αφού τη δημιουργήσει αν λείπει ή είναι παλιά."""
+    if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source):
+        with Image.open(source) as image:
+            height = round(image.height * width / image.width)
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        _save_variant(resized, path, fmt)
+
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def build_variants(name, source, widths, static_dir=STATIC_DIR):
+    """
+    Δημιουργεί (αν λείπουν ή είναι παλιές) τις εκδοχές μιας εικόνας
+    και τις κρατάει στη μνήμη.
+
+    Returns:
+        dict | None: {format: [(πλάτος, url), ...]} ή None αν λείπει η πηγή.
+    """
+    if not os.path.exists(source):
+        return None
+
+    os.makedirs(static_dir, exist_ok=True)
+    formats = ("webp", _fallback_format(source))
+    variants = {fmt: [] for fmt in formats}
+    for width in widths:
+        for fmt in formats:
+            filename = f"{name}-{width}.{EXTENSIONS[fmt]}"
+            content = _load_variant(source, os.path.join(static_dir, filename), width, fmt)
+            digest = hashlib.sha1(content).hexdigest()[:10]
+            hashed = f"{name}-{width}.{digest}.{EXTENSIONS[fmt]}"
+            _variants[hashed] = (content, MEDIA_TYPES[fmt])
+
+            if _route['enabled']:
+                url = f"{ASSET_ROUTE_URL}/{hashed}"
+            else:
+                url = f"{STATIC_URL}/{filename}?v={digest}"
+            variants[fmt].append((width, url))
+    return variants
+
+
+def build_assets(static_dir=STATIC_DIR):
+    """
+    Δημιουργεί όλες τις εκδοχές.
+
+    Returns:
+        dict: όνομα -> variants (None για εικόνες χωρίς τοπική πηγή).
+    """
+    return {
+        name: build_variants(name, source, widths, static_dir)
+        for name, source, widths in ASSET_SOURCES
+    }
+
+
+def picture_html(variants, alt, sizes, style=""):
+    """
+    HTML <picture> με WebP και fallback, ώστε ο browser να κατεβάζει
+    μόνο την εκδοχή που ταιριάζει στην οθόνη.
+
+    Args:
+        variants (dict): Αποτέλεσμα της build_variants.
+        alt (str): Εναλλακτικό κείμενο.
+        sizes (str): Το attribute sizes (π.χ. "130px" ή "100vw").
+        style (str): Επιπλέον CSS για το <img>.
+    """
+    def srcset(items):
+        return ", ".join(f"{url} {width}w" for width, url in items)
+
+    fallback_fmt = next(fmt for fmt in variants if fmt != "webp")
+    fallback = variants[fallback_fmt]
+    smallest_width, smallest_url = fallback[0]
+    return (
+        "<picture>"
+        f"<source type='image/webp' srcset='{srcset(variants['webp'])}' sizes='{sizes}'>"
+        f"<img src='{smallest_url}' srcset='{srcset(fallback)}' sizes='{sizes}' "
+        f"alt='{alt}' width='{smallest_width}' decoding='async' style='{style}'>"
+        "</picture>"
+    )
+
+
+def main():
+    """CLI: δημιουργεί τις εκδοχές (π.χ. στο build) και τις τυπώνει."""
+    for name, variants in build_assets().items():
+        if variants is None:
+            print(f"⚠️ {name}: δεν βρέθηκε τοπική πηγή, χρησιμοποιείται fallback.")
+            continue
+        for fmt, entries in variants.items():
+            for width, url in entries:
+                print(f"🖼️ {name} {fmt} {width}px -> {url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Updates tags based on specific varieties found in wine names.
 """
 
 import sqlite3
+import versions
 
 DB_NAME = 'wines.db'
 
@@ -57,6 +58,7 @@ def advanced_tagging():
             print(f"   🍷 Βρέθηκαν {count} κρασιά με '{keyword}' -> Updated!")
             total_updates += count
 
+    versions.bump_version(conn, versions.CATALOG)
     conn.commit()
     conn.close()
 
@@ -0,0 +1,206 @@
+"""
+Awards Parser for Wine Intelligence Elite.
+Μετατρέπει το ελεύθερο κείμενο της στήλης `awards` (π.χ. "94 pts Robert Parker",
+"Gold Thessaloniki", "4.0 Vivino") σε δομημένα πεδία στον πίνακα `wine_awards`.
+"""
+
+import re
+import sqlite3
+import pandas as pd
+import versions
+
+DB_NAME = 'wines.db'
+AWARDS_TABLE = 'wine_awards'
+
+# Ενοποίηση ονομάτων κριτικών (π.χ. "Parker" -> "Robert Parker")
+CRITIC_ALIASES = {
+    "parker": "Robert Parker",
+    "robert parker": "Robert Parker",
+    "decanter": "Decanter",
+    "wine enthusiast": "Wine Enthusiast",
+    "vivino": "Vivino",
+}
+
+# Οι μόνοι διαγωνισμοί που δέχεται ένα μετάλλιο, όπου κι αν γράφεται
+# ("Gold Thessaloniki", "Decanter Gold"). Έτσι τα "Organic Gold" ή
+# "Silver Standard Blend" δεν θεωρούνται μετάλλια.
+COMPETITION_ALIASES = {
+    "thessaloniki": "Thessaloniki",
+    "thess.": "Thessaloniki",
+    "decanter": "Decanter",
+    "mundus vini": "Mundus Vini",
+    "challenge int.": "Challenge International",
+    "crete": "Crete",
+    "lyon selection": "Lyon Selection",
+    "international": "International",
+}
+
+MEDALS = ["Double Gold", "Gold", "Silver", "Bronze"]
+_MEDAL_ALIASES = {medal.lower(): medal for medal in MEDALS}
+
+# Τα ονόματα δεν περιέχουν ',' ή ';': κείμενα με πολλά βραβεία
+# (π.χ. "92 pts Decanter, Gold Thessaloniki") μένουν στην αναφορά μη αναγνωρισμένων.
+_NAME = r"[^,;]+?"
+_MEDAL_RE = "|".join(MEDALS)
+_POINTS_PATTERN = rf"^(?P<points>\d{{2,3}}(?:\.\d+)?)\s*pts?\s+(?P<critic>{_NAME})$"
+_VIVINO_PATTERN = r"^(?P<points>\d(?:\.\d+)?)\s+(?P<critic>Vivino)$"
+# Προαιρετική λέξη "Medal" ("Gold Medal Thessaloniki", "Decanter Gold Medal")
+_MEDAL_FIRST_PATTERN = (
+    rf"^(?P<medal>{_MEDAL_RE})(?:\s+Medal)?\s+(?P<competition>{_NAME})$"
+)
+_MEDAL_LAST_PATTERN = rf"^(?P<competition>{_NAME})\s+(?P<medal>{_MEDAL_RE})(?:\s+Medal)?$"
+
+AWARD_COLUMNS = ['critic', 'points', 'medal', 'competition']
+
+
+def _normalize(value, aliases):
+    """Επιστρέφει το κανονικό όνομα από το λεξικό aliases (ή το ίδιο το κείμενο)."""
+    if value is None or pd.isna(value):
+        return None
+    value = value.strip()
+    return aliases.get(value.lower(), value)
+
+
+def parse_awards_series(awards):
+    """
+    Vectorized parsing μιας στήλης awards.
+
+    Args:
+        awards (pd.Series): Τα κείμενα των βραβείων.
+
+    Returns:
+        pd.DataFrame: Στήλες critic, points, medal, competition (ίδιο index).
+    """
+    text = awards.fillna("").astype(str).str.strip()
+    result = pd.DataFrame(index=text.index, columns=AWARD_COLUMNS, dtype=object)
+
+    # 1. Βαθμολογίες κριτικών ("92 pts Decanter", "4.0 Vivino")
+    for pattern in (_POINTS_PATTERN, _VIVINO_PATTERN):
+        found = text.str.extract(pattern, flags=re.IGNORECASE)
+        mask = found['points'].notna() & result['critic'].isna()
+        result.loc[mask, 'critic'] = found.loc[mask, 'critic']
+        result.loc[mask, 'points'] = found.loc[mask, 'points']
+
+    # 2. Μετάλλια ("Gold Thessaloniki" ή "Decanter Gold"), μόνο από γνωστούς
+    # διαγωνισμούς· τα υπόλοιπα μένουν στην αναφορά μη αναγνωρισμένων
+    unmatched = result['critic'].isna()
+    for pattern in (_MEDAL_FIRST_PATTERN, _MEDAL_LAST_PATTERN):
+        found = text.str.extract(pattern, flags=re.IGNORECASE)
+        known = found['competition'].str.strip().str.lower().isin(COMPETITION_ALIASES.keys())
+        mask = found['medal'].notna() & known & unmatched & result['medal'].isna()
+        result.loc[mask, 'medal'] = found.loc[mask, 'medal']
+        result.loc[mask, 'competition'] = found.loc[mask, 'competition']
+
+    result['critic'] = result['critic'].map(lambda v: _normalize(v, CRITIC_ALIASES))
+    result['medal'] = result['medal'].map(lambda v: _normalize(v, _MEDAL_ALIASES))
+    result['competition'] = result['competition'].map(
+        lambda v: _normalize(v, COMPETITION_ALIASES)
+    )
+    result['points'] = pd.to_numeric(result['points'], errors='coerce').astype(float)
+    return result
+
+
+def parse_award(text):
+    """
+    Parsing ενός μόνο κειμένου βραβείου.
+
+    Returns:
+        dict: critic, points, medal, competition (None όπου δεν βρέθηκε).
+    """
+    row = parse_awards_series(pd.Series([text])).iloc[0]
+    return {col: (None if pd.isna(row[col]) else row[col]) for col in AWARD_COLUMNS}
+
+
+def ensure_awards_table(conn):
+    """Δημιουργεί τον πίνακα wine_awards και τα indexes αν δεν υπάρχουν."""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {AWARDS_TABLE} (
+            wine_id INTEGER PRIMARY KEY,
+            awards TEXT,
+            critic TEXT,
+            points REAL,
+            medal TEXT,
+            competition TEXT
+        )""")
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_awards_critic_points "
+        f"ON {AWARDS_TABLE} (critic, points)"
+    )
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_awards_medal ON {AWARDS_TABLE} (medal)"
+    )
+
+
+def write_awards(conn, wine_ids, texts, parsed):
+    """
+    Ξαναγράφει τον πίνακα wine_awards με ήδη parsed εγγραφές (ένα batch).
+
+    Args:
+        conn (sqlite3.Connection): Ανοιχτή σύνδεση (το commit γίνεται από τον caller).
+        wine_ids (iterable): Τα id των κρασιών.
+        texts (iterable): Τα αρχικά κείμενα awards.
+        parsed (pd.DataFrame): Αποτέλεσμα της parse_awards_series.
+    """
+    ensure_awards_table(conn)
+    rows = [
+        (int(wine_id), text, critic,
+         None if pd.isna(points) else float(points), medal, competition)
+        for wine_id, text, critic, points, medal, competition in zip(
+            wine_ids, texts, parsed['critic'], parsed['points'],
+            parsed['medal'], parsed['competition']
+        )
+    ]
+    conn.execute(f"DELETE FROM {AWARDS_TABLE}")
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {AWARDS_TABLE} "
+        "(wine_id, awards, critic, points, medal, competition) VALUES (?,?,?,?,?,?)",
+        rows
+    )
+    versions.bump_version(conn, versions.CATALOG)
+    return len(rows)
+
+
+def sync_awards(conn, wines):
+    """
+    Ξαναγράφει τον πίνακα wine_awards για τα κρασιά του dataframe.
+
+    Args:
+        conn (sqlite3.Connection): Ανοιχτή σύνδεση (το commit γίνεται από τον caller).
+        wines (pd.DataFrame): Πρέπει να έχει στήλες id και awards.
+    """
+    wines = wines[wines['id'].notna()]
+    parsed = parse_awards_series(wines['awards'])
+    return write_awards(conn, wines['id'], wines['awards'], parsed)
+
+
+def reparse_all_awards(db_name=DB_NAME):
+    """Bulk re-parse όλων των υπαρχόντων κρασιών από το wine_intelligence."""
+    with sqlite3.connect(db_name) as conn:
+        wines = pd.read_sql("SELECT id, awards FROM wine_intelligence", conn)
+        return sync_awards(conn, wines)
+
+
+def unparsed_awards_report(db_name=DB_NAME):
+    """
+    Αναφορά για τα κείμενα που δεν αναγνωρίστηκαν ως βαθμολογία ή μετάλλιο.
+
+    Returns:
+        pd.DataFrame: awards και πλήθος κρασιών, ταξινομημένα φθίνουσα.
+    """
+    with sqlite3.connect(db_name) as conn:
+        ensure_awards_table(conn)
+        return pd.read_sql(f"""
+            SELECT awards, COUNT(*) AS wines FROM {AWARDS_TABLE}
+            WHERE critic IS NULL AND medal IS NULL
+              AND awards IS NOT NULL AND TRIM(awards) != ''
+            GROUP BY awards ORDER BY wines DESC, awards
+            """, conn)
+
+
+if __name__ == "__main__":
+    total = reparse_all_awards()
+    report = unparsed_awards_report()
+    print(f"🏆 Έγινε parsing σε {total} κρασιά.")
+    print(f"⚠️ Μη αναγνωρισμένα κείμενα: {len(report)}")
+    for _, item in report.iterrows():
+        print(f"   - {item['awards']} ({item['wines']})")
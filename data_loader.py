@@ -1,4 +1,6 @@
 import sqlite3
+import pandas as pd
+import awards
 
 def populate_ultimate_210():
     conn = sqlite3.connect('wines.db')
@@ -220,6 +222,7 @@ def populate_ultimate_210():
     ]
 
     cursor.executemany("INSERT INTO wine_intelligence (id, wine_name, category, score, awards, best_price, region, shop, url) VALUES (NULL,?,?,?,?,?,?,?,?)", wines)
+    awards.sync_awards(conn, pd.read_sql("SELECT id, awards FROM wine_intelligence", conn))
     conn.commit()
     conn.close()
     print(f"✅ ΣΤΡΑΤΗΓΙΚΟ COMMIT: Η βάση διαθέτει πλέον {len(wines)} ΠΡΑΓΜΑΤΙΚΕΣ ετικέτες!")
@@ -0,0 +1,392 @@
+"""
+Catalog Pipeline for Wine Intelligence Elite.
+Πλήρης επανυπολογισμός του `wine_intelligence` για πολύ μεγάλους καταλόγους:
+χωρίζει τα κρασιά σε partitions (εύρος id ή κατηγορία) και τρέχει τα στάδια
+ανά γραμμή (καθαρισμός ονόματος, tagging, parsing awards) σε process pool.
+Το VfM δεν αποθηκεύεται (το υπολογίζει το load_wine_data), οπότε δεν είναι στάδιο εδώ.
+
+Οι στήλες εισόδου (wine_name, awards) ζουν σε shared memory σε μορφή Arrow
+(UTF-8 bytes + offsets). Οι workers γράφουν τα αποτελέσματα σε κοινά buffers
+ως αριθμούς (πόντοι, κωδικοί tag / κριτικού / μεταλλίου / διαγωνισμού) και
+επιστρέφουν μόνο τα λίγα ονόματα που άλλαξαν και τα λεξιλόγια των κωδικών.
+Η εγγραφή στη βάση γίνεται με ένα batched transaction.
+
+Χρήση:
+    python pipeline.py --workers 4 --partition category
+    python pipeline.py --bench 1,2,4,8 --rows 1000000
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+import awards
+from auto_tag_ultimate import TAG_RULES
+
+DB_NAME = 'wines.db'
+PARTITION_MODES = ('id', 'category')
+TEXT_COLUMNS = ('wine_name', 'awards')
+# Στήλες εξόδου που γράφουν οι workers απευθείας στη shared memory
+OUTPUT_COLUMNS = {
+    'points': np.float64,
+    'tag_code': np.int16,
+    'critic_code': np.int32,
+    'medal_code': np.int32,
+    'competition_code': np.int32,
+}
+CODED_COLUMNS = ('critic', 'medal', 'competition')
+
+
+def _like_pattern(keyword):
+    """
+    Regex με τη σημασιολογία του SQLite LIKE που χρησιμοποιεί το auto_tag_ultimate:
+    case-insensitive μόνο για ASCII (το "XINOMAVRO" ταιριάζει, το "ΞΙΝΟΜΑΥΡΟ" όχι).
+    """
+    return "".join(
+        f"[{char.lower()}{char.upper()}]" if char.isascii() and char.isalpha()
+        else re.escape(char)
+        for char in keyword
+    )
+
+
+# Ένα regex ανά κανόνα, στη σειρά του auto_tag_ultimate:
+# όπως και εκεί, ο τελευταίος κανόνας που ταιριάζει κερδίζει.
+_TAG_PATTERNS = [
+    (tags, "|".join(_like_pattern(kw) for kw in keywords)) for tags, keywords in TAG_RULES
+]
+
+
+def normalize_names(names):
+    """Καθαρισμός ονομάτων: κενά στην αρχή/τέλος και πολλαπλά κενά."""
+    return names.fillna("").str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def tag_codes(names):
+    """
+    Vectorized εκδοχή του ultimate_tagging: ο δείκτης του κανόνα του TAG_RULES
+    που ταιριάζει σε κάθε όνομα (-1 = κανένας, μένει το υπάρχον food_pairing).
+    """
+    codes = np.full(len(names), -1, dtype=np.int16)
+    for code, (_, pattern) in enumerate(_TAG_PATTERNS):
+        codes[names.str.contains(pattern, regex=True).to_numpy()] = code
+    return codes
+
+
+def tag_names(names, food_pairing):
+    """Τα tags που προκύπτουν για κάθε όνομα (ή το υπάρχον food_pairing)."""
+    codes = tag_codes(names)
+    rule_tags = np.array([tags for tags, _ in TAG_RULES], dtype=object)
+    return pd.Series(
+        np.where(codes >= 0, rule_tags[np.maximum(codes, 0)],
+                 food_pairing.to_numpy(dtype=object)),
+        index=names.index
+    )
+
+
+# --- SHARED MEMORY ---
+def _pack_text(values):
+    """Arrow-style κωδικοποίηση: (offsets, UTF-8 bytes) για μια λίστα κειμένων."""
+    encoded = [("" if value is None else str(value)).encode() for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded) or b"\0", dtype=np.uint8)
+
+
+def _unpack_text(offsets, data, start, stop):
+    """Αποκωδικοποιεί τα κείμενα [start, stop) από τα κοινά buffers."""
+    base = offsets[start]
+    raw = data[base:offsets[stop]].tobytes()
+    bounds = (offsets[start:stop + 1] - base).tolist()
+    return [raw[begin:end].decode() for begin, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _share(blocks, buffers, column, array):
+    """Αντιγράφει ένα numpy array σε νέο shared memory block."""
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    blocks[column] = block
+    buffers[column] = (block.name, array.dtype.str, array.shape)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+
+
+def _share_catalog(blocks, buffers, catalog):
+    """Κείμενα εισόδου (Arrow-style) και κενά buffers εξόδου."""
+    for column in TEXT_COLUMNS:
+        offsets, data = _pack_text(catalog[column].tolist())
+        _share(blocks, buffers, f'{column}_offsets', offsets)
+        _share(blocks, buffers, f'{column}_data', data)
+    for column, dtype in OUTPUT_COLUMNS.items():
+        _share(blocks, buffers, column, np.zeros(len(catalog), dtype=dtype))
+
+
+def _attach(buffers):
+    """Σύνδεση σε υπάρχοντα shared memory blocks ως numpy arrays."""
+    blocks, arrays = [], {}
+    for column, (name, dtype, shape) in buffers.items():
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays[column] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    return blocks, arrays
+
+
+def _code_awards(arrays, start, stop):
+    """
+    Parsing των awards του [start, stop): πόντοι και κωδικοί (pd.factorize)
+    γράφονται στη shared memory· επιστρέφονται τα λεξιλόγια των κωδικών.
+    """
+    parsed = awards.parse_awards_series(pd.Series(_unpack_text(
+        arrays['awards_offsets'], arrays['awards_data'], start, stop
+    ), dtype=object))
+    arrays['points'][start:stop] = parsed['points'].to_numpy(dtype=np.float64)
+    vocabularies = {}
+    for column in CODED_COLUMNS:
+        codes, uniques = pd.factorize(parsed[column], use_na_sentinel=True)
+        arrays[f'{column}_code'][start:stop] = codes
+        vocabularies[column] = uniques.tolist()
+    return vocabularies
+
+
+def _process_partition(task):
+    """
+    Worker: επεξεργάζεται το κομμάτι [start, stop) του καταλόγου.
+    Διαβάζει και γράφει στη shared memory· επιστρέφει μόνο τα ονόματα που
+    άλλαξαν και τα λεξιλόγια των κωδικών κριτικού/μεταλλίου/διαγωνισμού.
+    """
+    buffers, start, stop = task
+    blocks, arrays = _attach(buffers)
+    try:
+        names = pd.Series(_unpack_text(
+            arrays['wine_name_offsets'], arrays['wine_name_data'], start, stop
+        ), dtype=object)
+        clean_names = normalize_names(names)
+        arrays['tag_code'][start:stop] = tag_codes(clean_names)
+        changed_names = {
+            start + position: name
+            for position, name in enumerate(clean_names.tolist())
+            if name != names.iat[position]
+        }
+
+        vocabularies = _code_awards(arrays, start, stop)
+    finally:
+        arrays.clear()
+        for block in blocks:
+            block.close()
+    return start, stop, changed_names, vocabularies
+
+
+def make_partitions(catalog, mode, workers):
+    """
+    Ταξινομεί τον κατάλογο ώστε κάθε partition να είναι συνεχές κομμάτι.
+
+    Args:
+        catalog (pd.DataFrame): Ο κατάλογος (στήλες του wine_intelligence).
+        mode (str): 'id' (ίσα εύρη id) ή 'category' (μία ή περισσότερες ανά κατηγορία).
+        workers (int): Πλήθος workers.
+
+    Returns:
+        tuple: (ταξινομημένος κατάλογος, λίστα από (start, stop))
+    """
+    if mode not in PARTITION_MODES:
+        raise ValueError(f"Unknown partition mode: {mode}")
+
+    sort_by = ['id'] if mode == 'id' else ['category', 'id']
+    catalog = catalog.sort_values(sort_by, kind='stable').reset_index(drop=True)
+    total = len(catalog)
+    # Μικρά κομμάτια (4 ανά worker) για καλύτερη κατανομή φορτίου
+    chunk = max(1, -(-total // (workers * 4)))
+
+    if mode == 'id':
+        bounds = [0]
+    else:
+        categories = catalog['category'].fillna("").to_numpy()
+        bounds = [0] + (np.flatnonzero(categories[1:] != categories[:-1]) + 1).tolist()
+    bounds.append(total)
+
+    partitions = []
+    for group_start, group_stop in zip(bounds[:-1], bounds[1:]):
+        for start in range(group_start, group_stop, chunk):
+            partitions.append((start, min(start + chunk, group_stop)))
+    return catalog, partitions
+
+
+def _decode_awards(coded, outputs, vocabularies, window):
+    """Κωδικοί ενός partition -> κείμενα (το -1 δείχνει στο τελευταίο στοιχείο: None)."""
+    for column, uniques in vocabularies.items():
+        lookup = np.array(uniques + [None], dtype=object)
+        coded[column][window] = lookup[outputs[f'{column}_code'][window]]
+
+
+def _merge_results(catalog, results, outputs):
+    """
+    Συνθέτει τον τελικό κατάλογο από τα κοινά buffers εξόδου (vectorized).
+    Ονόματα και food_pairing αλλάζουν μόνο όπου το είπε ένα στάδιο·
+    οι υπόλοιπες τιμές (και τα NULL) γράφονται πίσω όπως ήταν.
+    """
+    output = catalog.copy()
+    total = len(output)
+
+    names = output['wine_name'].to_numpy(dtype=object, copy=True)
+    coded = {column: np.empty(total, dtype=object) for column in CODED_COLUMNS}
+    for start, stop, changed_names, vocabularies in results:
+        if changed_names:
+            names[list(changed_names)] = list(changed_names.values())
+        _decode_awards(coded, outputs, vocabularies, slice(start, stop))
+
+    rule_tags = np.array([tags for tags, _ in TAG_RULES], dtype=object)
+    codes = outputs['tag_code']
+    output['wine_name'] = names
+    output['food_pairing'] = np.where(
+        codes >= 0, rule_tags[np.maximum(codes, 0)],
+        output['food_pairing'].to_numpy(dtype=object)
+    )
+    for column in CODED_COLUMNS:
+        output[column] = coded[column]
+    output['points'] = outputs['points'].copy()
+    return output
+
+
+def default_workers():
+    """Οι πυρήνες που μπορεί πράγματι να χρησιμοποιήσει η διεργασία."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def run_pipeline(catalog, workers=None, mode='id'):
+    """
+    Τρέχει τα στάδια ανά γραμμή σε process pool.
+
+    Args:
+        catalog (pd.DataFrame): Ο κατάλογος (στήλες του wine_intelligence).
+        workers (int): Πλήθος διεργασιών (προεπιλογή: οι διαθέσιμοι πυρήνες).
+        mode (str): Τρόπος partitioning ('id' ή 'category').
+
+    Returns:
+        pd.DataFrame: Ο κατάλογος με καθαρά ονόματα, tags και parsed awards.
+    """
+    workers = workers or default_workers()
+    catalog = catalog[catalog['id'].notna()]
+    catalog, partitions = make_partitions(catalog, mode, workers)
+    total = len(catalog)
+    if total == 0:
+        return catalog
+
+    blocks, buffers = {}, {}
+    try:
+        _share_catalog(blocks, buffers, catalog)
+        tasks = [(buffers, start, stop) for start, stop in partitions]
+        if workers == 1:
+            results = [_process_partition(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_process_partition, tasks))
+
+        outputs = {
+            column: np.ndarray((total,), dtype=dtype, buffer=blocks[column].buf)
+            for column, dtype in OUTPUT_COLUMNS.items()
+        }
+        output = _merge_results(catalog, results, outputs)
+        outputs.clear()
+        return output
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+
+def write_results(output, db_name=DB_NAME):
+    """
+    Αποθήκευση όλων των partitions με ένα batched transaction.
+    Το to_sql(if_exists='replace') του save_wine_data σβήνει το primary key,
+    οπότε φτιάχνουμε index στο id: αλλιώς κάθε UPDATE σαρώνει όλο τον πίνακα.
+    Το write_awards αυξάνει την έκδοση του καταλόγου στο ίδιο transaction.
+    """
+    with sqlite3.connect(db_name) as conn:
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_wine_intelligence_id ON wine_intelligence (id)"
+        )
+        conn.executemany(
+            "UPDATE wine_intelligence SET wine_name = ?, food_pairing = ? WHERE id = ?",
+            zip(output['wine_name'], output['food_pairing'], output['id'].astype(int).tolist())
+        )
+        awards.write_awards(
+            conn, output['id'], output['awards'], output[awards.AWARD_COLUMNS]
+        )
+
+
+def load_catalog(db_name=DB_NAME):
+    """Φορτώνει τον κατάλογο από τη βάση."""
+    with sqlite3.connect(db_name) as conn:
+        catalog = pd.read_sql("SELECT * FROM wine_intelligence", conn)
+    if 'food_pairing' not in catalog.columns:
+        catalog['food_pairing'] = ""
+    return catalog
+
+
+def benchmark(catalog, core_counts, rows=None, mode='id'):
+    """
+    Μετράει υπολογισμό ΚΑΙ εγγραφή για διάφορα πλήθη πυρήνων, σε προσωρινό
+    αντίγραφο της βάσης (χωρίς index στο id, όπως μετά από save_wine_data).
+
+    Args:
+        catalog (pd.DataFrame): Ο κατάλογος.
+        core_counts (list): Π.χ. [1, 2, 4, 8].
+        rows (int): Αν δοθεί, ο κατάλογος επαναλαμβάνεται μέχρι τόσες γραμμές.
+
+    Returns:
+        pd.DataFrame: workers, compute_s, write_s, seconds, speedup.
+    """
+    if rows:
+        repeats = -(-rows // len(catalog))
+        catalog = pd.concat([catalog] * repeats, ignore_index=True).head(rows)
+        catalog['id'] = np.arange(1, len(catalog) + 1)
+
+    timings = []
+    with tempfile.TemporaryDirectory() as scratch:
+        for workers in core_counts:
+            db_name = os.path.join(scratch, f"bench_{workers}.db")
+            with sqlite3.connect(db_name) as conn:
+                catalog.to_sql('wine_intelligence', conn, if_exists='replace', index=False)
+
+            started = time.perf_counter()
+            output = run_pipeline(catalog, workers, mode)
+            computed = time.perf_counter()
+            write_results(output, db_name)
+            finished = time.perf_counter()
+            timings.append((workers, computed - started, finished - computed,
+                            finished - started))
+
+    report = pd.DataFrame(timings, columns=['workers', 'compute_s', 'write_s', 'seconds'])
+    report['speedup'] = report['seconds'].iloc[0] / report['seconds']
+    return report
+
+
+def main():
+    """CLI του pipeline."""
+    parser = argparse.ArgumentParser(description="Wine Intelligence catalog pipeline")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--partition", choices=PARTITION_MODES, default='id')
+    parser.add_argument("--bench", help="Λίστα πυρήνων, π.χ. 1,2,4,8")
+    parser.add_argument("--rows", type=int, default=None)
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+    if args.bench:
+        core_counts = [int(count) for count in args.bench.split(",")]
+        print(f"Διαθέσιμοι πυρήνες: {default_workers()}")
+        print(benchmark(catalog, core_counts, args.rows, args.partition).to_string(index=False))
+        return
+
+    started = time.perf_counter()
+    output = run_pipeline(catalog, args.workers, args.partition)
+    write_results(output)
+    print(f"🚀 Επεξεργάστηκαν {len(output)} κρασιά σε {time.perf_counter() - started:.2f}s.")
+
+
+if __name__ == "__main__":
+    main()
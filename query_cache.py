@@ -0,0 +1,90 @@
+"""
+Shared Query Cache for Wine Intelligence Elite.
+Κοινή (για όλη τη διεργασία) LRU cache για τα αποτελέσματα φίλτρων/ταξινόμησης.
+Αποθηκεύει μόνο πίνακες θέσεων γραμμών (numpy arrays), όχι αντίγραφα DataFrame.
+"""
+
+import threading
+from collections import OrderedDict
+
+MAX_ENTRIES = 256
+MAX_BYTES = 16 * 1024 * 1024  # 16 MB
+
+_entries = OrderedDict()
+_lock = threading.Lock()
+_counters = {'hits': 0, 'misses': 0, 'evictions': 0}
+_state = {'bytes': 0}
+
+
+def make_key(data_version, *filters):
+    """
+    Κανονικοποιημένο κλειδί: ίδια επιλογή με διαφορετική σειρά καταλήγει
+    στο ίδιο entry. Τα κείμενα μπαίνουν αυτούσια· όποια κανονικοποίηση
+    (π.χ. του search) γίνεται από τον caller, ώστε κλειδί και φίλτρο να συμφωνούν.
+
+    Args:
+        data_version: Η έκδοση των δεδομένων (αλλάζει σε κάθε αποθήκευση).
+        *filters: Τιμές φίλτρων (str, list/set, tuple, αριθμοί ή None).
+    """
+    normalized = []
+    for value in filters:
+        if isinstance(value, (list, set, frozenset)):
+            value = tuple(sorted(value))
+        elif isinstance(value, tuple):
+            value = tuple(float(v) if isinstance(v, (int, float)) else v for v in value)
+        normalized.append(value)
+    return (data_version, tuple(normalized))
+
+
+def get(key):
+    """Επιστρέφει τις θέσεις γραμμών για το key ή None (miss)."""
+    with _lock:
+        positions = _entries.get(key)
+        if positions is None:
+            _counters['misses'] += 1
+            return None
+        _entries.move_to_end(key)
+        _counters['hits'] += 1
+        return positions
+
+
+def put(key, positions):
+    """Αποθηκεύει τις θέσεις γραμμών και κάνει LRU eviction αν χρειάζεται."""
+    size = positions.nbytes
+    if size > MAX_BYTES:
+        return
+
+    positions.setflags(write=False)
+    with _lock:
+        old = _entries.pop(key, None)
+        if old is not None:
+            _state['bytes'] -= old.nbytes
+        _entries[key] = positions
+        _state['bytes'] += size
+
+        while len(_entries) > MAX_ENTRIES or _state['bytes'] > MAX_BYTES:
+            _, evicted = _entries.popitem(last=False)
+            _state['bytes'] -= evicted.nbytes
+            _counters['evictions'] += 1
+
+
+def clear():
+    """Αδειάζει την cache (οι μετρητές διατηρούνται)."""
+    with _lock:
+        _entries.clear()
+        _state['bytes'] = 0
+
+
+def stats():
+    """
+    Μετρητές της cache.
+
+    Returns:
+        dict: hits, misses, evictions, entries, bytes.
+    """
+    with _lock:
+        return {
+            **_counters,
+            'entries': len(_entries),
+            'bytes': _state['bytes'],
+        }
@@ -0,0 +1,31 @@
+"""
+ASGI entrypoint for Wine Intelligence Elite.
+Τρέχει το app.py μέσω st.App και προσθέτει το route /assets/, που σερβίρει
+τις εκδοχές εικόνων από τη μνήμη με μακροχρόνια cache headers.
+
+Χρήση:
+    streamlit run server.py
+"""
+
+import streamlit as st
+from starlette.responses import Response
+from starlette.routing import Route
+import assets
+
+# Τα ονόματα περιέχουν το hash του περιεχομένου, άρα δεν αλλάζουν ποτέ
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+async def serve_asset(request):
+    """Σερβίρει μία εκδοχή εικόνας από τη μνήμη."""
+    variant = assets.get_variant(request.path_params["filename"])
+    if variant is None:
+        return Response(status_code=404)
+    content, media_type = variant
+    return Response(content, media_type=media_type, headers={"Cache-Control": CACHE_CONTROL})
+
+
+assets.enable_asset_route()
+assets.build_assets()
+
+app = st.App("app.py", routes=[Route("/assets/{filename}", serve_asset)])
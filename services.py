@@ -5,11 +5,53 @@ Created by VST & AI.
 """
 
 import sqlite3
+import numpy as np
 import pandas as pd
+import alerts
+import awards
+import versions
 
 DB_NAME = 'wines.db'
 
 
+def get_data_version(scope=versions.CATALOG):
+    """
+    Έκδοση των δεδομένων μιας ομάδας πινάκων: αλλάζει μόνο όταν γράφεται
+    η ίδια η ομάδα (π.χ. ο κατάλογος από αποθήκευση, tagging scripts, awards
+    re-parse, pipeline· οι ειδοποιήσεις από τον κύκλο του alerts.py).
+
+    Args:
+        scope (str): versions.CATALOG ή versions.ALERTS.
+
+    Returns:
+        int | None: Η έκδοση ή None αν λείπει η βάση.
+    """
+    try:
+        return versions.get_version(scope, DB_NAME)
+    except sqlite3.Error as error:
+        print(f"Error reading data version: {error}")
+        return None
+
+
+def compute_vfm(scores, prices):
+    """
+    Vectorized VfM Score = Rating / Τιμή * 10 (0 όταν δεν υπάρχει θετική τιμή).
+
+    Args:
+        scores (array-like): Οι βαθμολογίες.
+        prices (array-like): Οι τιμές.
+
+    Returns:
+        np.ndarray: Τα VfM scores.
+    """
+    scores = np.asarray(scores, dtype=float)
+    prices = np.asarray(prices, dtype=float)
+    valid = prices > 0
+    result = np.zeros(len(prices))
+    np.divide(scores * 10, prices, out=result, where=valid)
+    return result
+
+
 def load_wine_data():
     """
     Φορτώνει τα δεδομένα από τη βάση SQLite και υπολογίζει τα KPIs.
@@ -22,6 +64,14 @@ def load_wine_data():
         with sqlite3.connect(DB_NAME) as conn:
             data = pd.read_sql("SELECT * FROM wine_intelligence", conn)
 
+            # Πρώτη εκκίνηση: γεμίζουμε τον πίνακα wine_awards αν είναι άδειος
+            awards.ensure_awards_table(conn)
+            has_awards = conn.execute(
+                f"SELECT 1 FROM {awards.AWARDS_TABLE} LIMIT 1"
+            ).fetchone()
+            if not has_awards and not data.empty:
+                awards.sync_awards(conn, data)
+
         # 1. Καθαρισμός των "None" στις σημειώσεις
         if 'notes' not in data.columns:
             data['notes'] = ""
@@ -39,11 +89,7 @@ def load_wine_data():
         data['live_check'] = base_url + data['wine_name'].str.replace(' ', '+')
 
         # 4. Υπολογισμός VfM Score
-        data['VfM_Score'] = data.apply(
-            lambda row: (row['score'] / row['best_price'] * 10)
-            if row['best_price'] > 0 else 0,
-            axis=1
-        )
+        data['VfM_Score'] = compute_vfm(data['score'], data['best_price'])
 
         return data
 
@@ -74,5 +120,101 @@ def save_wine_data(dataframe):
                 'wine_intelligence', conn,
                 if_exists='replace', index=False
             )
+            # Parsing των awards κατά την αποθήκευση (ingest-time)
+            if {'id', 'awards'}.issubset(to_save.columns):
+                awards.sync_awards(conn, to_save)
+            versions.bump_version(conn, versions.CATALOG)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        print(f"Error saving data: {error}")
+
+def get_award_critics():
+    """
+    Επιστρέφει τους κριτικούς που υπάρχουν στον πίνακα wine_awards.
+
+    Returns:
+        pd.DataFrame: critic, min_points, max_points.
+    """
+    try:
+        with sqlite3.connect(DB_NAME) as conn:
+            awards.ensure_awards_table(conn)
+            return pd.read_sql(f"""
+                SELECT critic, MIN(points) AS min_points, MAX(points) AS max_points
+                FROM {awards.AWARDS_TABLE}
+                WHERE critic IS NOT NULL
+                GROUP BY critic ORDER BY critic
+                """, conn)
     except Exception as error:  # pylint: disable=broad-exception-caught
-        print(f"Error saving data: {error}")
\ No newline at end of file
+        print(f"Error loading critics: {error}")
+        return pd.DataFrame(columns=['critic', 'min_points', 'max_points'])
+
+
+def find_award_wine_ids(critic=None, min_points=None, gold_only=False):
+    """
+    Βρίσκει τα id των κρασιών που ταιριάζουν στα φίλτρα βραβείων (index lookup).
+
+    Args:
+        critic (str): Κριτικός (π.χ. "Decanter") ή None.
+        min_points (float): Ελάχιστη βαθμολογία του κριτικού.
+        gold_only (bool): Μόνο κρασιά με μετάλλιο Gold / Double Gold.
+
+    Returns:
+        set | None: Τα id ή None αν δεν έχει επιλεγεί κανένα φίλτρο.
+    """
+    if not critic and not gold_only:
+        return None
+
+    queries = []
+    if critic:
+        if min_points is None:
+            min_points = float('-inf')
+        queries.append((
+            f"SELECT wine_id FROM {awards.AWARDS_TABLE} WHERE critic = ? AND points >= ?",
+            (critic, float(min_points))
+        ))
+    if gold_only:
+        queries.append((
+            f"SELECT wine_id FROM {awards.AWARDS_TABLE} "
+            "WHERE medal IN ('Gold', 'Double Gold')",
+            ()
+        ))
+
+    try:
+        with sqlite3.connect(DB_NAME) as conn:
+            awards.ensure_awards_table(conn)
+            # Κάθε φίλτρο είναι ξεχωριστό index lookup, κρατάμε την τομή
+            id_sets = [
+                {row[0] for row in conn.execute(query, params)}
+                for query, params in queries
+            ]
+            return set.intersection(*id_sets)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        print(f"Error filtering awards: {error}")
+        return set()
+
+
+def refresh_deal_alerts():
+    """
+    Τρέχει έναν κύκλο της μηχανής ειδοποιήσεων (μόνο νέες/αλλαγμένες προσφορές).
+
+    Returns:
+        tuple: (προσφορές που ελέγχθηκαν, νέες ειδοποιήσεις)
+    """
+    try:
+        return alerts.run_alert_cycle(DB_NAME)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        print(f"Error running deal alerts: {error}")
+        return 0, 0
+
+
+def load_deal_alerts(limit=200):
+    """
+    Φορτώνει τις πιο πρόσφατες ειδοποιήσεις προσφορών.
+
+    Returns:
+        pd.DataFrame: Οι ειδοποιήσεις (κενό σε σφάλμα).
+    """
+    try:
+        return alerts.load_alerts(DB_NAME, limit)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        print(f"Error loading deal alerts: {error}")
+        return pd.DataFrame()
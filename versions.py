@@ -0,0 +1,55 @@
+"""
+Data Versions for Wine Intelligence Elite.
+Μετρητής έκδοσης ανά ομάδα πινάκων (`catalog`: wine_intelligence + wine_awards,
+`alerts`: deal_alerts). Όποιος γράφει σε μια ομάδα αυξάνει τον μετρητή της,
+ώστε οι caches της εφαρμογής να ακυρώνονται μόνο όταν αλλάζουν τα δικά τους δεδομένα
+(π.χ. ένας κύκλος του alerts.py δεν ακυρώνει τον κατάλογο).
+"""
+
+import os
+import sqlite3
+
+DB_NAME = 'wines.db'
+VERSIONS_TABLE = 'data_versions'
+CATALOG = 'catalog'
+ALERTS = 'alerts'
+
+
+def bump_version(conn, scope=CATALOG):
+    """
+    Αυξάνει την έκδοση μιας ομάδας πινάκων.
+
+    Args:
+        conn (sqlite3.Connection): Ανοιχτή σύνδεση (το commit γίνεται από τον caller).
+        scope (str): CATALOG ή ALERTS.
+    """
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {VERSIONS_TABLE} (
+            scope TEXT PRIMARY KEY,
+            version INTEGER NOT NULL
+        )""")
+    conn.execute(
+        f"INSERT INTO {VERSIONS_TABLE} (scope, version) VALUES (?, 1) "
+        "ON CONFLICT (scope) DO UPDATE SET version = version + 1",
+        (scope,)
+    )
+
+
+def get_version(scope=CATALOG, db_name=DB_NAME):
+    """
+    Η τρέχουσα έκδοση μιας ομάδας πινάκων.
+
+    Returns:
+        int | None: Η έκδοση (0 πριν την πρώτη εγγραφή) ή None αν λείπει η βάση.
+    """
+    if not os.path.exists(db_name):
+        return None
+    with sqlite3.connect(db_name) as conn:
+        try:
+            row = conn.execute(
+                f"SELECT version FROM {VERSIONS_TABLE} WHERE scope = ?", (scope,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # Ο πίνακας δεν υπάρχει ακόμα (καμία εγγραφή από την αναβάθμιση)
+            return 0
+    return row[0] if row else 0